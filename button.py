@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -22,7 +24,6 @@ from .const import (
     CMD_SET_SPEED_2,
     CMD_SET_SPEED_3,
     CMD_SET_SPEED_4,
-    CONF_NAME,
     DOMAIN,
 )
 from .coordinator import HeltyVMCCoordinator
@@ -36,6 +37,9 @@ class HeltyVMCButtonDescription(ButtonEntityDescription):
     """Describes a Helty VMC button."""
 
     command: str
+    # Expected status after the command, applied without polling the device
+    speed: int | None = None
+    led_on: bool | None = None
 
 
 BUTTON_DESCRIPTIONS: tuple[HeltyVMCButtonDescription, ...] = (
@@ -44,60 +48,70 @@ BUTTON_DESCRIPTIONS: tuple[HeltyVMCButtonDescription, ...] = (
         translation_key="speed_0",
         icon="mdi:fan-off",
         command=CMD_SET_SPEED_0,
+        speed=0,
     ),
     HeltyVMCButtonDescription(
         key="speed_1",
         translation_key="speed_1",
         icon="mdi:fan-speed-1",
         command=CMD_SET_SPEED_1,
+        speed=1,
     ),
     HeltyVMCButtonDescription(
         key="speed_2",
         translation_key="speed_2",
         icon="mdi:fan-speed-2",
         command=CMD_SET_SPEED_2,
+        speed=2,
     ),
     HeltyVMCButtonDescription(
         key="speed_3",
         translation_key="speed_3",
         icon="mdi:fan-speed-3",
         command=CMD_SET_SPEED_3,
+        speed=3,
     ),
     HeltyVMCButtonDescription(
         key="speed_4",
         translation_key="speed_4",
         icon="mdi:fan",
         command=CMD_SET_SPEED_4,
+        speed=4,
     ),
     HeltyVMCButtonDescription(
         key="boost",
         translation_key="boost",
         icon="mdi:fan-plus",
         command=CMD_SET_BOOST,
+        speed=5,
     ),
     HeltyVMCButtonDescription(
         key="night_mode",
         translation_key="night_mode",
         icon="mdi:weather-night",
         command=CMD_SET_NIGHT,
+        speed=6,
     ),
     HeltyVMCButtonDescription(
         key="free_cooling",
         translation_key="free_cooling",
         icon="mdi:snowflake",
         command=CMD_SET_FREE_COOLING,
+        speed=7,
     ),
     HeltyVMCButtonDescription(
         key="led_on",
         translation_key="led_on",
         icon="mdi:led-on",
         command=CMD_LED_ON,
+        led_on=True,
     ),
     HeltyVMCButtonDescription(
         key="led_off",
         translation_key="led_off",
         icon="mdi:led-off",
         command=CMD_LED_OFF,
+        led_on=False,
     ),
     HeltyVMCButtonDescription(
         key="reset_filter",
@@ -117,19 +131,26 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     protocol: HeltyVMCProtocol = data["protocol"]
     coordinator: HeltyVMCCoordinator = data["coordinator"]
-    name = entry.data.get(CONF_NAME, "Helty VMC")
-
-    entities = [
-        HeltyVMCButton(protocol, coordinator, entry, name, description)
+    device_info: DeviceInfo = data["device_info"]
+    entry_id = entry.entry_id
+
+    async_add_entities(
+        HeltyVMCButton(
+            protocol,
+            coordinator,
+            device_info,
+            sys.intern(f"{entry_id}_{description.key}"),
+            description,
+        )
         for description in BUTTON_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    )
 
 
 class HeltyVMCButton(ButtonEntity):
     """Button to control Helty VMC."""
 
+    __slots__ = ("_protocol", "_coordinator")
+
     _attr_has_entity_name = True
     entity_description: HeltyVMCButtonDescription
 
@@ -137,30 +158,31 @@ class HeltyVMCButton(ButtonEntity):
         self,
         protocol: HeltyVMCProtocol,
         coordinator: HeltyVMCCoordinator,
-        entry: ConfigEntry,
-        name: str,
+        device_info: DeviceInfo,
+        unique_id: str,
         description: HeltyVMCButtonDescription,
     ) -> None:
         """Initialize the button."""
         self._protocol = protocol
         self._coordinator = coordinator
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._protocol.send_raw_command(self.entity_description.command)
-        # Refresh state after command
+        description = self.entity_description
+        changes: dict[str, Any] = {}
+        if description.speed is not None:
+            changes["speed"] = description.speed
+        if description.led_on is not None:
+            changes["led_on"] = description.led_on
+
+        if (
+            await self._protocol.send_raw_command(description.command)
+            and changes
+            and self._coordinator.async_set_status(**changes)
+        ):
+            return
+        # Refresh state when the outcome is not known locally
         await self._coordinator.async_request_refresh()
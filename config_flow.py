@@ -37,10 +37,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     """Validate the user input allows us to connect."""
     protocol = HeltyVMCProtocol(data[CONF_HOST], data.get(CONF_PORT, DEFAULT_PORT))
 
-    if not await protocol.check_connection():
-        raise CannotConnect
+    try:
+        info = await protocol.probe()
+    finally:
+        await protocol.async_close()
 
-    info = await protocol.get_info()
+    if info is None:
+        raise CannotConnect
 
     return {"title": data.get(CONF_NAME) or info.name or "Helty VMC"}
 
@@ -1,9 +1,14 @@
 """Constants for the Helty VMC integration."""
+from types import MappingProxyType
 
 DOMAIN = "helty_vmc"
 DEFAULT_PORT = 5001
 DEFAULT_TIMEOUT = 15
+DEFAULT_IDLE_TIMEOUT = 60  # close the device connection after this many idle seconds
 DEFAULT_SCAN_INTERVAL = 30
+REQUEST_REFRESH_COOLDOWN = 0.3  # seconds to coalesce refreshes after commands
+FRAME_GAP = 0.2  # seconds of silence that end a reply sent without a newline
+PIPELINE_MAX_FAILURES = 3  # failed pipelined batches in a row before commands go singly
 
 # VMC Commands
 CMD_GET_STATUS = "VMGH?"
@@ -28,31 +33,42 @@ CMD_LED_ON = "VMWH0100010"
 CMD_LED_OFF = "VMWH0100000"
 CMD_RESET_FILTER = "VMWH0417744"
 
-# Speed modes mapping
-SPEED_MODES = {
-    0: "off",
-    1: "speed_1",
-    2: "speed_2",
-    3: "speed_3",
-    4: "speed_4",
-    5: "boost",
-    6: "night",
-    7: "free_cooling",
-}
+# Speed mode names and commands, indexed by speed code
+SPEED_MODES_TUPLE = (
+    "off",
+    "speed_1",
+    "speed_2",
+    "speed_3",
+    "speed_4",
+    "boost",
+    "night",
+    "free_cooling",
+)
 
-SPEED_COMMANDS = {
-    "off": CMD_SET_SPEED_0,
-    "speed_1": CMD_SET_SPEED_1,
-    "speed_2": CMD_SET_SPEED_2,
-    "speed_3": CMD_SET_SPEED_3,
-    "speed_4": CMD_SET_SPEED_4,
-    "boost": CMD_SET_BOOST,
-    "night": CMD_SET_NIGHT,
-    "free_cooling": CMD_SET_FREE_COOLING,
-}
+SPEED_COMMANDS_TUPLE = (
+    CMD_SET_SPEED_0,
+    CMD_SET_SPEED_1,
+    CMD_SET_SPEED_2,
+    CMD_SET_SPEED_3,
+    CMD_SET_SPEED_4,
+    CMD_SET_BOOST,
+    CMD_SET_NIGHT,
+    CMD_SET_FREE_COOLING,
+)
+
+# Fan preset modes: every speed mode except off
+PRESET_MODES = SPEED_MODES_TUPLE[1:]
+
+# Speed code for each mode name, for indexing the tuples above
+PRESET_MODE_INDEX = MappingProxyType(
+    {mode: code for code, mode in enumerate(SPEED_MODES_TUPLE)}
+)
+
+# Speed code for each fan percentage 0-100 (speeds 1-4 in 25% steps)
+PCT_TO_SPEED = tuple(max(1, min(4, (percentage + 24) // 25)) for percentage in range(101))
 
 # Airflow rates in m³/h for each speed (typical values for Helty Flow Plus)
-AIRFLOW_RATES = {
+AIRFLOW_RATES = MappingProxyType({
     0: 0,
     1: 15,
     2: 30,
@@ -61,7 +77,7 @@ AIRFLOW_RATES = {
     5: 80,  # boost
     6: 10,  # night
     7: 60,  # free cooling
-}
+})
 
 CONF_HOST = "host"
 CONF_PORT = "port"
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, REQUEST_REFRESH_COOLDOWN
 from .protocol import HeltyVMCProtocol, VMCSensors, VMCStatus
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,14 +31,20 @@ class HeltyVMCCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # Status and sensors are frozen dataclasses compared by value, so
+            # listeners are only called when a poll returns something new
+            always_update=False,
+            # Coalesce refreshes requested by bursts of button/fan commands
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.protocol = protocol
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from VMC."""
         try:
-            status = await self.protocol.get_status()
-            sensors = await self.protocol.get_sensors()
+            status, sensors = await self.protocol.get_status_and_sensors()
 
             if not status.is_online:
                 raise UpdateFailed("VMC is offline or not responding")
@@ -49,6 +57,18 @@ class HeltyVMCCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             raise UpdateFailed(f"Error fetching VMC data: {err}") from err
 
+    @callback
+    def async_set_status(self, **changes: Any) -> bool:
+        """Optimistically apply the status change caused by a command.
+
+        Listeners are updated without polling the device. Returns False if
+        there is no status to update yet.
+        """
+        if (status := self.status) is None:
+            return False
+        self.async_set_updated_data({**self.data, "status": replace(status, **changes)})
+        return True
+
     @property
     def status(self) -> VMCStatus | None:
         """Return the current status."""
@@ -0,0 +1,28 @@
+"""Base entity for Helty VMC."""
+from __future__ import annotations
+
+import sys
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import HeltyVMCCoordinator
+
+
+class HeltyVMCBaseEntity(CoordinatorEntity[HeltyVMCCoordinator]):
+    """Base class for Helty VMC entities backed by the coordinator."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: HeltyVMCCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+        unique_suffix: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_unique_id = sys.intern(f"{entry.entry_id}_{unique_suffix}")
+        self._attr_device_info = device_info
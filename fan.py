@@ -6,19 +6,23 @@ from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_NAME, DOMAIN, SPEED_COMMANDS
+from .const import (
+    DOMAIN,
+    PCT_TO_SPEED,
+    PRESET_MODE_INDEX,
+    PRESET_MODES,
+    SPEED_COMMANDS_TUPLE,
+)
 from .coordinator import HeltyVMCCoordinator
+from .entity import HeltyVMCBaseEntity
 from .protocol import HeltyVMCProtocol
 
 _LOGGER = logging.getLogger(__name__)
 
-PRESET_MODES = ["speed_1", "speed_2", "speed_3", "speed_4", "boost", "night", "free_cooling"]
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,15 +33,16 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: HeltyVMCCoordinator = data["coordinator"]
     protocol: HeltyVMCProtocol = data["protocol"]
-    name = entry.data.get(CONF_NAME, "Helty VMC")
+    device_info: DeviceInfo = data["device_info"]
 
-    async_add_entities([HeltyVMCFan(coordinator, protocol, entry, name)])
+    async_add_entities((HeltyVMCFan(coordinator, protocol, entry, device_info),))
 
 
-class HeltyVMCFan(CoordinatorEntity[HeltyVMCCoordinator], FanEntity):
+class HeltyVMCFan(HeltyVMCBaseEntity, FanEntity):
     """Representation of the Helty VMC fan."""
 
-    _attr_has_entity_name = True
+    __slots__ = ("_protocol",)
+
     _attr_name = None
     _attr_supported_features = FanEntityFeature.PRESET_MODE | FanEntityFeature.TURN_OFF | FanEntityFeature.TURN_ON
 
@@ -46,46 +51,34 @@ class HeltyVMCFan(CoordinatorEntity[HeltyVMCCoordinator], FanEntity):
         coordinator: HeltyVMCCoordinator,
         protocol: HeltyVMCProtocol,
         entry: ConfigEntry,
-        name: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the fan."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, device_info, "fan")
         self._protocol = protocol
-        self._attr_unique_id = f"{entry.entry_id}_fan"
-        self._attr_preset_modes = PRESET_MODES
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
+        self._attr_preset_modes = list(PRESET_MODES)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the fan is on."""
-        if self.coordinator.status:
-            return self.coordinator.status.speed > 0
-        return None
+        status = self.coordinator.status
+        return status.speed > 0 if status is not None else None
 
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        if self.coordinator.status:
-            mode = self.coordinator.status.speed_mode
+        status = self.coordinator.status
+        if status is not None:
+            mode = status.speed_mode
             return mode if mode in PRESET_MODES else None
         return None
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        if self.coordinator.status:
-            speed = self.coordinator.status.speed
+        status = self.coordinator.status
+        if status is not None:
+            speed = status.speed
             if speed == 0:
                 return 0
             # Map speeds 1-4 to 25-100%, special modes to 100%
@@ -105,29 +98,25 @@ class HeltyVMCFan(CoordinatorEntity[HeltyVMCCoordinator], FanEntity):
             await self.async_set_preset_mode(preset_mode)
         elif percentage:
             # Map percentage to speed 1-4
-            speed = max(1, min(4, (percentage + 24) // 25))
-            command = SPEED_COMMANDS.get(f"speed_{speed}")
-            if command:
-                await self._protocol.send_raw_command(command)
-                await self.coordinator.async_request_refresh()
+            await self._async_set_speed(PCT_TO_SPEED[min(max(percentage, 0), 100)])
         else:
             # Default to speed 2
-            await self._protocol.send_raw_command(SPEED_COMMANDS["speed_2"])
-            await self.coordinator.async_request_refresh()
+            await self._async_set_speed(2)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan."""
-        await self._protocol.send_raw_command(SPEED_COMMANDS["off"])
-        await self.coordinator.async_request_refresh()
+        await self._async_set_speed(0)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        command = SPEED_COMMANDS.get(preset_mode)
-        if command:
-            await self._protocol.send_raw_command(command)
+        speed = PRESET_MODE_INDEX.get(preset_mode)
+        if speed is not None:
+            await self._async_set_speed(speed)
+
+    async def _async_set_speed(self, speed: int) -> None:
+        """Send a speed command and show the new speed right away."""
+        if not (
+            await self._protocol.send_raw_command(SPEED_COMMANDS_TUPLE[speed])
+            and self.coordinator.async_set_status(speed=speed)
+        ):
             await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
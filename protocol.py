@@ -2,35 +2,78 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 import logging
+import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 from .const import (
     CMD_GET_NAME,
     CMD_GET_SENSORS,
     CMD_GET_STATUS,
+    DEFAULT_IDLE_TIMEOUT,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
-    SPEED_MODES,
+    FRAME_GAP,
+    PIPELINE_MAX_FAILURES,
+    SPEED_MODES_TUPLE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
-@dataclass
+# Query commands, encoded once at import
+_B_CMD_GET_STATUS = CMD_GET_STATUS.encode()
+_B_CMD_GET_SENSORS = CMD_GET_SENSORS.encode()
+_B_CMD_GET_NAME = CMD_GET_NAME.encode()
+
+# VMGO,<speed [1]>,_,_,<sensors [4]>,_,...,_,<led [14]>
+# Trailing fields are optional so short frames still yield what they carry.
+_STATUS_RE = re.compile(
+    rb"VMGO"
+    rb"(?:,(?P<speed>[^,]*)"
+    rb"(?:(?:,[^,]*){2},(?P<sensors>[^,]*)"
+    rb"(?:(?:,[^,]*){9},(?P<led>[^,]*))?)?)?"
+)
+
+# VMIO,<temp int [1]>,<temp ext [2]>,<humidity [3]>,<co2 [4]>,_,...,_,<voc [11]>
+_SENSORS_RE = re.compile(
+    rb"[^,]*"
+    rb",(?P<temperature_internal>[^,]*)"
+    rb",(?P<temperature_external>[^,]*)"
+    rb",(?P<humidity_internal>[^,]*)"
+    rb",(?P<co2>[^,]*)"
+    rb"(?:,[^,]*){6}"
+    rb",(?P<voc>[^,]*)"
+)
+
+
+def _encode(command: str | bytes) -> bytes:
+    """Return the wire form of a command, encoding it only if needed."""
+    return command if isinstance(command, bytes) else command.encode()
+
+
+@dataclass(frozen=True, slots=True)
 class VMCStatus:
     """VMC device status."""
 
     speed: int = 0
-    speed_mode: str = "off"
     is_online: bool = False
     led_on: bool | None = None
     led_filter_warning: bool = False  # True when LED shows "check filter" (code 00032)
     sensors_on: bool | None = None
 
+    @property
+    def speed_mode(self) -> str:
+        """Return the speed mode name for the current speed code."""
+        if 0 <= self.speed < len(SPEED_MODES_TUPLE):
+            return SPEED_MODES_TUPLE[self.speed]
+        return "unknown"
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VMCSensors:
     """VMC sensor readings."""
 
@@ -42,7 +85,7 @@ class VMCSensors:
     filter_hours: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VMCInfo:
     """VMC device info."""
 
@@ -57,36 +100,127 @@ class HeltyVMCProtocol:
         host: str,
         port: int = DEFAULT_PORT,
         timeout: float = DEFAULT_TIMEOUT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
     ) -> None:
         """Initialize the protocol handler."""
         self.host = host
         self.port = port
         self.timeout = timeout
+        self.idle_timeout = idle_timeout
         self._lock = asyncio.Lock()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._idle_handle: asyncio.TimerHandle | None = None
+        # Pipelined batches in a row the device did not answer in full
+        self._pipeline_failures = 0
 
-    async def _send_command(self, command: str) -> str | None:
-        """Send a command and receive response."""
-        async with self._lock:
-            try:
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(self.host, self.port),
-                    timeout=self.timeout,
-                )
-
-                writer.write(command.encode())
-                await writer.drain()
+    async def _ensure_connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Return the open connection, opening a new one if needed.
 
-                response = await asyncio.wait_for(
-                    reader.read(1024),
-                    timeout=self.timeout,
-                )
+        A reused connection on which the device sent anything since the last
+        reply is replaced, so stray bytes cannot answer the next command.
+        """
+        if self._reader is not None and self._writer is not None and not self._writer.is_closing():
+            if not await self._has_pending_data(self._reader):
+                return self._reader, self._writer
+            _LOGGER.debug("Unexpected data from VMC at %s:%s, reconnecting", self.host, self.port)
+            await self._reset_connection()
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        return self._reader, self._writer
 
-                writer.close()
+    @staticmethod
+    async def _has_pending_data(reader: asyncio.StreamReader) -> bool:
+        """Return True if data or EOF is buffered, without waiting for more."""
+        try:
+            # A zero timeout only interrupts the read if it has to wait
+            async with asyncio.timeout(0):
+                await reader.read(1)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _reset_connection(self) -> None:
+        """Close the connection so the next command reopens it."""
+        self._cancel_idle_close()
+        writer = self._writer
+        self._reader = self._writer = None
+        if writer is not None:
+            writer.close()
+            try:
                 await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _schedule_idle_close(self) -> None:
+        """(Re)start the timer that closes the connection when unused."""
+        self._cancel_idle_close()
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            self.idle_timeout, self._close_idle
+        )
+
+    def _cancel_idle_close(self) -> None:
+        """Cancel the idle close timer."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _close_idle(self) -> None:
+        """Close the connection after idle_timeout seconds without commands."""
+        self._idle_handle = None
+        if self._lock.locked():
+            # A command is in flight and will reschedule the timer
+            return
+        if self._writer is not None:
+            _LOGGER.debug("Closing idle connection to VMC at %s:%s", self.host, self.port)
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _exchange(
+        self,
+        payload: bytes,
+        read: Callable[[asyncio.StreamReader], Awaitable[_T]],
+    ) -> _T:
+        """Write payload on the shared connection and return read(reader).
+
+        Must be called with the lock held. One timeout covers connecting,
+        writing and reading. If a reused connection turns out to have been
+        dropped by the device, it is reopened once before giving up.
+        """
+        reused = self._writer is not None
+        while True:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    reader, writer = await self._ensure_connection()
+                    writer.write(payload)
+                    await writer.drain()
+                    result = await read(reader)
+            except asyncio.TimeoutError:
+                await self._reset_connection()
+                raise
+            except OSError:
+                await self._reset_connection()
+                if not reused:
+                    raise
+                reused = False
+                continue
+
+            self._schedule_idle_close()
+            return result
+
+    async def async_close(self) -> None:
+        """Close the connection to the device."""
+        async with self._lock:
+            await self._reset_connection()
 
-                decoded = response.decode().strip()
-                _LOGGER.debug("Command %s response: %s", command, decoded)
-                return decoded
+    async def _send_command(self, command: str | bytes) -> bytes | None:
+        """Send a command and receive the raw response."""
+        async with self._lock:
+            try:
+                response = await self._exchange_frame(command)
+
+                response = response.strip()
+                _LOGGER.debug("Command %s response: %s", command, response)
+                return response
 
             except asyncio.TimeoutError:
                 _LOGGER.warning("Timeout communicating with VMC at %s:%s", self.host, self.port)
@@ -95,61 +229,168 @@ class HeltyVMCProtocol:
                 _LOGGER.warning("Error communicating with VMC at %s:%s: %s", self.host, self.port, err)
                 return None
 
-    async def send_raw_command(self, command: str) -> bool:
+    async def _exchange_frame(self, command: str | bytes) -> bytes:
+        """Send one command and read its response frame.
+
+        Must be called with the lock held.
+        """
+        frame = await self._exchange(_encode(command), self._read_frame)
+        if not frame.endswith(b"\n"):
+            # The rest of the reply may still arrive; do not let it answer
+            # the next command
+            await self._reset_connection()
+        return frame
+
+    async def _send_batch(self, commands: list[str | bytes]) -> list[bytes | None]:
+        """Send several commands in one exchange and collect the responses.
+
+        Commands are written back-to-back and one newline-terminated response
+        is read per command. Commands the device did not answer that way are
+        sent singly, and after PIPELINE_MAX_FAILURES such batches in a row
+        all commands are. Responses that could not be read are None.
+        """
+        frames: list[bytes] = []
+
+        async def read_frames(reader: asyncio.StreamReader) -> bool:
+            frames.clear()
+            for _ in commands:
+                try:
+                    frame = await self._read_frame(reader)
+                except ConnectionResetError:
+                    if not frames:
+                        raise
+                    # Device hung up after the first reply
+                    break
+                if not frame.endswith(b"\n"):
+                    # Without a newline this reply may run into the next ones
+                    frames.clear()
+                    return False
+                frames.append(frame)
+            return True
+
+        async with self._lock:
+            try:
+                if self._pipeline_failures < PIPELINE_MAX_FAILURES:
+                    try:
+                        if not await self._exchange(
+                            b"".join(_encode(command) for command in commands), read_frames
+                        ):
+                            await self._reset_connection()
+                    except asyncio.TimeoutError:
+                        if not frames:
+                            raise
+                        # Device ignored the pipelined commands after the first reply
+                    if len(frames) == len(commands):
+                        self._pipeline_failures = 0
+                    else:
+                        self._pipeline_failures += 1
+                        _LOGGER.debug("Pipelined commands not answered in full, sending singly")
+                for command in commands[len(frames):]:
+                    frames.append(await self._exchange_frame(command))
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timeout communicating with VMC at %s:%s", self.host, self.port)
+            except OSError as err:
+                _LOGGER.warning("Error communicating with VMC at %s:%s: %s", self.host, self.port, err)
+
+        responses: list[bytes | None] = []
+        for command, frame in zip(commands, frames):
+            response = frame.strip()
+            _LOGGER.debug("Command %s response: %s", command, response)
+            responses.append(response)
+        responses.extend([None] * (len(commands) - len(responses)))
+        return responses
+
+    @staticmethod
+    async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+        """Read one response frame.
+
+        Frames are read up to a newline so they stay aligned on the persistent
+        connection even if TCP splits or merges them. Bare terminators left
+        over from an earlier reply are skipped. The terminator has not been
+        confirmed on hardware, so a reply followed by FRAME_GAP seconds of
+        silence without a newline is returned as-is, like a plain read, and
+        so is a frame cut short by the device closing the connection. Callers
+        must reset the connection after a frame that does not end in a newline.
+        """
+        head = b"\n"
+        while head in (b"\r", b"\n"):
+            try:
+                head = await reader.readexactly(1)
+            except asyncio.IncompleteReadError as err:
+                raise ConnectionResetError("Connection closed by VMC") from err
+
+        try:
+            return head + await asyncio.wait_for(reader.readuntil(b"\n"), FRAME_GAP)
+        except asyncio.IncompleteReadError as err:
+            return head + err.partial
+        except asyncio.TimeoutError:
+            pass
+
+        # No terminator: take whatever the device has sent so far
+        try:
+            return head + await asyncio.wait_for(reader.read(1024), FRAME_GAP)
+        except asyncio.TimeoutError:
+            return head
+
+    async def send_raw_command(self, command: str | bytes) -> bool:
         """Send a raw command to the VMC."""
         result = await self._send_command(command)
         return result is not None
 
     async def get_status(self) -> VMCStatus:
-        """Get the current VMC status.
+        """Get the current VMC status."""
+        return self._parse_status(await self._send_command(_B_CMD_GET_STATUS))
+
+    async def get_sensors(self) -> VMCSensors:
+        """Get sensor readings."""
+        return self._parse_sensors(await self._send_command(_B_CMD_GET_SENSORS))
+
+    async def get_status_and_sensors(self) -> tuple[VMCStatus, VMCSensors]:
+        """Get status and sensor readings in a single pipelined exchange."""
+        status_response, sensors_response = await self._send_batch(
+            [_B_CMD_GET_STATUS, _B_CMD_GET_SENSORS]
+        )
+        return self._parse_status(status_response), self._parse_sensors(sensors_response)
+
+    @staticmethod
+    def _parse_status(response: bytes | None) -> VMCStatus:
+        """Parse a VMGH? response.
 
         Response format: VMGO,00001,00000,00000,00000,00000,...,00000
         Index [1]: current speed (00000-00007)
         Index [4]: sensors status (00000/00001=on, 00002/00003=off)
         Index [14]: LED panel status (00000=off, others=on, 00032=check filter)
         """
-        status = VMCStatus()
-        response = await self._send_command(CMD_GET_STATUS)
+        status: dict[str, Any] = {}
+        match = _STATUS_RE.match(response) if response else None
 
-        if response and response.startswith("VMGO"):
-            parts = response.split(",")
-            _LOGGER.debug("VMGH? parsed %d parts", len(parts))
-            
+        if match:
             # Speed [1]
-            if len(parts) > 1:
+            if (speed_raw := match["speed"]) is not None:
                 try:
-                    speed_val = int(parts[1])
-                    status.speed = speed_val
-                    status.speed_mode = SPEED_MODES.get(speed_val, "unknown")
-                    status.is_online = True
+                    status["speed"] = int(speed_raw)
+                    status["is_online"] = True
                 except ValueError:
-                    _LOGGER.warning("Invalid speed value in response: %s", parts[1])
-            
+                    _LOGGER.warning("Invalid speed value in response: %s", speed_raw)
+
             # Sensors status [4]
-            if len(parts) > 4:
-                try:
-                    sensors_code = parts[4]
-                    status.sensors_on = sensors_code in ("00000", "00001")
-                    _LOGGER.debug("Sensors status raw=%s parsed=%s", sensors_code, status.sensors_on)
-                except (ValueError, IndexError):
-                    pass
-            
+            if (sensors_code := match["sensors"]) is not None:
+                status["sensors_on"] = sensors_code in (b"00000", b"00001")
+                _LOGGER.debug("Sensors status raw=%s parsed=%s", sensors_code, status["sensors_on"])
+
             # LED panel status [14]
-            if len(parts) > 14:
-                try:
-                    led_code = parts[14]
-                    status.led_on = led_code != "00000"
-                    status.led_filter_warning = led_code == "00032"
-                    _LOGGER.debug("LED status raw=%s on=%s filter_warning=%s", led_code, status.led_on, status.led_filter_warning)
-                except (ValueError, IndexError):
-                    pass
+            if (led_code := match["led"]) is not None:
+                status["led_on"] = led_code != b"00000"
+                status["led_filter_warning"] = led_code == b"00032"
+                _LOGGER.debug("LED status raw=%s on=%s filter_warning=%s", led_code, status["led_on"], status["led_filter_warning"])
         else:
-            status.is_online = response is not None
+            status["is_online"] = response is not None
 
-        return status
+        return VMCStatus(**status)
 
-    async def get_sensors(self) -> VMCSensors:
-        """Get sensor readings.
+    @classmethod
+    def _parse_sensors(cls, response: bytes | None) -> VMCSensors:
+        """Parse a VMGI? response.
 
         Response format: VMIO,TTTTT,TTTTT,HHHHH,CCCCC,...,VVVVV,...
         Index [1]: External temperature (divide by 10, first digit 1 = negative)
@@ -158,67 +399,77 @@ class HeltyVMCProtocol:
         Index [4]: CO2 in ppm
         Index [11]: VOC in ppb
         """
-        sensors = VMCSensors()
-        response = await self._send_command(CMD_GET_SENSORS)
-
         _LOGGER.debug("VMGI? raw response: %s", response)
 
-        if response:
-            # Handle both VMIO prefix and raw response
-            if response.startswith("VMIO"):
-                parts = response.split(",")
-            elif "," in response:
-                # Some devices may respond without prefix
-                parts = response.split(",")
-            else:
-                _LOGGER.warning("Unexpected sensor response format: %s", response)
-                return sensors
-
-            _LOGGER.debug("Parsed %d parts from sensor response", len(parts))
-
-            # Internal temperature [1]
-            if len(parts) > 1:
-                sensors.temperature_internal = self._parse_temperature(parts[1])
-                _LOGGER.debug("Internal temp raw=%s parsed=%s", parts[1], sensors.temperature_internal)
-
-            # External temperature [2]
-            if len(parts) > 2:
-                sensors.temperature_external = self._parse_temperature(parts[2])
-                _LOGGER.debug("External temp raw=%s parsed=%s", parts[2], sensors.temperature_external)
-
-            # Internal humidity [3]
-            if len(parts) > 3:
-                sensors.humidity_internal = self._parse_humidity(parts[3])
-                _LOGGER.debug("Humidity raw=%s parsed=%s", parts[3], sensors.humidity_internal)
-
-            # CO2 [4]
-            if len(parts) > 4:
-                sensors.co2 = self._parse_int(parts[4])
-
-            # VOC [11]
-            if len(parts) > 11:
-                sensors.voc = self._parse_int(parts[11])
+        if not response:
+            return VMCSensors()
+
+        # Any prefix is accepted (some devices omit VMIO); frames too short
+        # to reach the VOC field [11] are rejected as a whole.
+        match = _SENSORS_RE.match(response)
+        if match is None:
+            _LOGGER.warning("Short or unexpected sensor response: %s", response)
+            return VMCSensors()
+
+        sensors = VMCSensors(
+            # Internal temperature [1], external temperature [2], humidity [3]
+            temperature_internal=cls._parse_temperature(match["temperature_internal"]),
+            temperature_external=cls._parse_temperature(match["temperature_external"]),
+            humidity_internal=cls._parse_humidity(match["humidity_internal"]),
+            # CO2 [4], VOC [11]
+            co2=cls._parse_int(match["co2"]),
+            voc=cls._parse_int(match["voc"]),
+        )
+        _LOGGER.debug(
+            "Sensors parsed: temp_int=%s temp_ext=%s humidity=%s co2=%s voc=%s",
+            sensors.temperature_internal,
+            sensors.temperature_external,
+            sensors.humidity_internal,
+            sensors.co2,
+            sensors.voc,
+        )
 
         return sensors
 
     async def get_info(self) -> VMCInfo:
         """Get device information."""
+        return self._parse_info(await self._send_command(_B_CMD_GET_NAME))
+
+    async def check_connection(self) -> bool:
+        """Check if the device is reachable."""
+        response = await self._send_command(_B_CMD_GET_STATUS)
+        return response is not None and response.startswith(b"VMGO")
+
+    async def probe(self) -> VMCInfo | None:
+        """Check the device is reachable and get its info in one exchange.
+
+        Returns None if the device does not answer the status query. A device
+        that answers the status query but not the name query gets the default
+        info.
+        """
+        status_response, name_response = await self._send_batch(
+            [_B_CMD_GET_STATUS, _B_CMD_GET_NAME]
+        )
+        if status_response is None or not status_response.startswith(b"VMGO"):
+            return None
+        if name_response is None:
+            _LOGGER.debug("No response to %s, using default device info", CMD_GET_NAME)
+            return VMCInfo()
+        return self._parse_info(name_response)
+
+    @staticmethod
+    def _parse_info(response: bytes | None) -> VMCInfo:
+        """Parse a VMNM? response."""
         info = VMCInfo()
-        response = await self._send_command(CMD_GET_NAME)
 
         if response:
             # Response format varies, typically contains the name
-            info.name = response.strip()
+            info.name = response.decode().strip()
 
         return info
 
-    async def check_connection(self) -> bool:
-        """Check if the device is reachable."""
-        response = await self._send_command(CMD_GET_STATUS)
-        return response is not None and response.startswith("VMGO")
-
     @staticmethod
-    def _parse_temperature(value: str) -> float | None:
+    def _parse_temperature(value: bytes) -> float | None:
         """Parse temperature value.
 
         Format: 5 digits where first digit 1 = negative temperature.
@@ -226,21 +477,14 @@ class HeltyVMCProtocol:
         Value (without sign indicator) divided by 10 for actual temperature.
         """
         try:
-            if not value or not value.strip():
-                return None
-            value = value.strip()
-            if value.startswith("1") and len(value) == 5:
-                # Negative temperature: first digit is 1, rest is temp * 10
-                temp_part = value[1:]
-                return -(int(temp_part) / 10)
-            else:
-                # Positive temperature
-                return int(value) / 10
-        except (ValueError, IndexError):
+            raw = int(value)
+        except ValueError:
             return None
+        # Negative temperature: first of the 5 digits is 1, rest is temp * 10
+        return -(raw - 10000) / 10 if raw >= 10000 else raw / 10
 
     @staticmethod
-    def _parse_humidity(value: str) -> float | None:
+    def _parse_humidity(value: bytes) -> float | None:
         """Parse humidity value (divide by 10)."""
         try:
             val = float(value) / 10
@@ -249,7 +493,7 @@ class HeltyVMCProtocol:
             return None
 
     @staticmethod
-    def _parse_int(value: str) -> int | None:
+    def _parse_int(value: bytes) -> int | None:
         """Parse integer value."""
         try:
             val = int(value)
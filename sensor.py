@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import operator
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,22 +21,27 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import AIRFLOW_RATES, CONF_NAME, DOMAIN
+from .const import AIRFLOW_RATES, DOMAIN, SPEED_MODES_TUPLE
 from .coordinator import HeltyVMCCoordinator
+from .entity import HeltyVMCBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_SPEED_OPTIONS_SET: frozenset[str] = frozenset(SPEED_MODES_TUPLE)
+_AIRFLOW_BY_SPEED: tuple[int, ...] = tuple(
+    AIRFLOW_RATES.get(speed, 0) for speed in range(len(SPEED_MODES_TUPLE))
+)
+
 
 @dataclass(frozen=True, kw_only=True)
 class HeltyVMCSensorDescription(SensorEntityDescription):
     """Describes a Helty VMC sensor."""
 
-    value_fn: str
+    value_fn: Callable[[Any], Any]
 
 
 SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
@@ -44,7 +51,7 @@ SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn="temperature_internal",
+        value_fn=operator.attrgetter("temperature_internal"),
     ),
     HeltyVMCSensorDescription(
         key="temperature_external",
@@ -52,7 +59,7 @@ SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn="temperature_external",
+        value_fn=operator.attrgetter("temperature_external"),
     ),
     HeltyVMCSensorDescription(
         key="humidity_internal",
@@ -60,7 +67,7 @@ SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn="humidity_internal",
+        value_fn=operator.attrgetter("humidity_internal"),
     ),
     HeltyVMCSensorDescription(
         key="co2",
@@ -68,7 +75,7 @@ SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn="co2",
+        value_fn=operator.attrgetter("co2"),
     ),
     HeltyVMCSensorDescription(
         key="voc",
@@ -76,7 +83,7 @@ SENSOR_DESCRIPTIONS: tuple[HeltyVMCSensorDescription, ...] = (
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_BILLION,
         device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn="voc",
+        value_fn=operator.attrgetter("voc"),
     ),
 )
 
@@ -89,199 +96,94 @@ async def async_setup_entry(
     """Set up Helty VMC sensors."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: HeltyVMCCoordinator = data["coordinator"]
-    name = entry.data.get(CONF_NAME, "Helty VMC")
-
-    entities: list[SensorEntity] = []
+    device_info: DeviceInfo = data["device_info"]
 
     # Add sensor entities
-    for description in SENSOR_DESCRIPTIONS:
-        entities.append(HeltyVMCSensor(coordinator, entry, name, description))
+    entities: list[SensorEntity] = [
+        HeltyVMCSensor(coordinator, entry, device_info, description)
+        for description in SENSOR_DESCRIPTIONS
+    ]
 
     # Add speed and airflow sensors
-    entities.append(HeltyVMCSpeedSensor(coordinator, entry, name))
-    entities.append(HeltyVMCSpeedNumericSensor(coordinator, entry, name))
-    entities.append(HeltyVMCAirflowSensor(coordinator, entry, name))
+    entities.extend((
+        HeltyVMCSpeedSensor(coordinator, entry, device_info, "speed_mode"),
+        HeltyVMCSpeedNumericSensor(coordinator, entry, device_info, "speed"),
+        HeltyVMCAirflowSensor(coordinator, entry, device_info, "airflow"),
+    ))
 
     async_add_entities(entities)
 
 
-class HeltyVMCSensor(CoordinatorEntity[HeltyVMCCoordinator], SensorEntity):
+class HeltyVMCSensor(HeltyVMCBaseEntity, SensorEntity):
     """Representation of a Helty VMC sensor."""
 
-    _attr_has_entity_name = True
     entity_description: HeltyVMCSensorDescription
 
     def __init__(
         self,
         coordinator: HeltyVMCCoordinator,
         entry: ConfigEntry,
-        name: str,
+        device_info: DeviceInfo,
         description: HeltyVMCSensorDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, device_info, description.key)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
 
     @property
     def native_value(self) -> float | int | None:
         """Return the sensor value."""
-        if self.coordinator.sensors:
-            return getattr(self.coordinator.sensors, self.entity_description.value_fn, None)
-        return None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        sensors = self.coordinator.sensors
+        return self.entity_description.value_fn(sensors) if sensors is not None else None
 
 
-class HeltyVMCSpeedSensor(CoordinatorEntity[HeltyVMCCoordinator], SensorEntity):
+class HeltyVMCSpeedSensor(HeltyVMCBaseEntity, SensorEntity):
     """Sensor for current speed mode."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "speed_mode"
     _attr_icon = "mdi:fan"
     _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = ["off", "speed_1", "speed_2", "speed_3", "speed_4", "boost", "night", "free_cooling"]
-
-    def __init__(
-        self,
-        coordinator: HeltyVMCCoordinator,
-        entry: ConfigEntry,
-        name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_speed_mode"
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
+    _attr_options = list(SPEED_MODES_TUPLE)
 
     @property
     def native_value(self) -> str | None:
         """Return the current speed mode."""
-        if self.coordinator.status:
-            mode = self.coordinator.status.speed_mode
+        status = self.coordinator.status
+        if status is not None:
+            mode = status.speed_mode
             # Ensure returned value is always in options list
-            if mode in self._attr_options:
+            if mode in _SPEED_OPTIONS_SET:
                 return mode
             return "off"
         return None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class HeltyVMCSpeedNumericSensor(CoordinatorEntity[HeltyVMCCoordinator], SensorEntity):
+class HeltyVMCSpeedNumericSensor(HeltyVMCBaseEntity, SensorEntity):
     """Numeric sensor for current speed (0-7)."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "speed"
     _attr_icon = "mdi:speedometer"
 
-    def __init__(
-        self,
-        coordinator: HeltyVMCCoordinator,
-        entry: ConfigEntry,
-        name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_speed"
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
-
     @property
     def native_value(self) -> int | None:
         """Return the current speed as number (0-7)."""
-        if self.coordinator.status:
-            return self.coordinator.status.speed
-        return None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        status = self.coordinator.status
+        return status.speed if status is not None else None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
 
-
-class HeltyVMCAirflowSensor(CoordinatorEntity[HeltyVMCCoordinator], SensorEntity):
+class HeltyVMCAirflowSensor(HeltyVMCBaseEntity, SensorEntity):
     """Sensor for airflow rate."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "airflow"
     _attr_native_unit_of_measurement = "m³/h"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:weather-windy"
 
-    def __init__(
-        self,
-        coordinator: HeltyVMCCoordinator,
-        entry: ConfigEntry,
-        name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_airflow"
-        self._name = name
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=self._name,
-            manufacturer="Helty",
-            model="Flow Plus/Elite",
-        )
-
     @property
     def native_value(self) -> int | None:
         """Return the current airflow rate."""
-        if self.coordinator.status:
-            return AIRFLOW_RATES.get(self.coordinator.status.speed, 0)
+        status = self.coordinator.status
+        if status is not None:
+            speed = status.speed
+            return _AIRFLOW_BY_SPEED[speed] if 0 <= speed < len(_AIRFLOW_BY_SPEED) else 0
         return None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()